@@ -6,23 +6,205 @@ import time
 import json
 import threading
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from queue import Queue, Empty
+import numpy as np
+from sgp4.api import SatrecArray
 from skyfield.api import load, wgs84
 
+try:
+    import orjson  # C-level NDJSON serializer for the storage kernel
+except ImportError:
+    orjson = None
+
+try:
+    import numba  # JIT for the fused per-tick metrics kernel
+except ImportError:
+    numba = None
+
 # =============================================================================
 # HIGH-ADVANCEMENT CONFIGURATION (THE FUTURE-NOW KERNEL)
 # =============================================================================
 # Updated API Endpoint for CelesTrak GP (General Perturbations)
 SAT_SOURCE_API = 'https://celestrak.org/NORAD/elements/gp.php?GROUP=active&FORMAT=tle'
+TLE_CACHE_FILE = "tle_cache.tle"
+TLE_CACHE_TTL = 3600  # Seconds; CelesTrak refreshes roughly hourly
 GHOST_TRACE_BUFFER = 50  # Number of past positions kept in "memory ether"
+HEARTBEAT_PERIOD = 1.0   # Target seconds between harvest sweeps (phase-locked)
 BINARY_CORE_FILE = "subspace_telemetry.bin"
 DATA_MATRIX_FILE = "sat_intelligence.json"
+DISK_FLUSH_INTERVAL = 5.0  # Seconds between forced flushes of the stream buffers
+CLEAR_SCREEN = "\033[H\033[2J"  # ANSI cursor-home + clear (no shell fork)
 
 # Signal Constants
 KU_BAND_FREQ = 12.0e9  # 12 GHz
 C = 299792458          # Speed of Light (m/s)
 
+# Binary Signal Format, fixed-point quantized:
+# ID (u32), Lat/Lon (i32, 1e-7 deg ~= 1 cm), Alt (i32, metres, covers GEO),
+# Doppler (i16, 100 Hz steps), Time (f64). The JSON stream keeps full floats.
+PKT_STRUCT = struct.Struct('!Iiiihd')
+LATLON_SCALE = 1e7     # Degrees -> 1e-7 deg LSB
+ALT_SCALE = 1e3        # km -> metres
+DOPPLER_SCALE = 100.0  # Hz per LSB (i16 spans +/- 3.3 MHz of shift)
+
+# Constant FSPL terms folded out of the hot loop: 20*log10(f_GHz) + 92.45
+FSPL_CONST = 20 * math.log10(KU_BAND_FREQ / 1e9) + 92.45
+
+# Ground Station: Burrard Inlet Uplink Array (Vancouver, BC)
+GS_LAT = 49.2905
+GS_LON = -123.1109
+GROUND_STATION = wgs84.latlon(GS_LAT, GS_LON)
+# The station never moves in the Earth-fixed frame: solve its ECEF vector
+# once here and rotate it into TEME per tick instead of re-deriving it.
+GS_ECEF = np.array(GROUND_STATION.itrs_xyz.km)
+EARTH_OMEGA = 7.2921158553e-5  # Earth rotation rate (rad/s)
+
+# WGS84 Ellipsoid (for the vectorized subpoint math)
+WGS84_A = 6378.137             # Equatorial radius (km)
+WGS84_E2 = 6.69437999014e-3    # First eccentricity squared
+
+# Geodetic interpolation grid: (geocentric latitude, radius) -> (lat, alt).
+# Solved iteratively once at import; per-tick conversion is then a bilinear
+# blend of four grid cells instead of iterative transcendental refinement.
+GRID_NLAT = 721
+GRID_NR = 256
+GRID_R_MIN = WGS84_A - 100.0
+GRID_R_MAX = 50000.0
+
+
+def _solve_geodetic(r_xy, z):
+    """Reference iterative geodetic solve (used only to fill the grid)."""
+    lats = np.arctan2(z, r_xy)
+    for _ in range(5):
+        sin_lat = np.sin(lats)
+        c = WGS84_A / np.sqrt(1.0 - WGS84_E2 * sin_lat * sin_lat)
+        lats = np.arctan2(z + c * WGS84_E2 * sin_lat, r_xy)
+    sin_lat = np.sin(lats)
+    alts = r_xy * np.cos(lats) + z * sin_lat - WGS84_A * np.sqrt(1.0 - WGS84_E2 * sin_lat * sin_lat)
+    return lats, alts
+
+
+def _build_geodetic_grid():
+    phi_c = np.linspace(-np.pi / 2, np.pi / 2, GRID_NLAT)
+    radii = np.linspace(GRID_R_MIN, GRID_R_MAX, GRID_NR)
+    pc, rr = np.meshgrid(phi_c, radii, indexing='ij')
+    return _solve_geodetic(rr * np.cos(pc), rr * np.sin(pc))
+
+
+LAT_GRID, ALT_GRID = _build_geodetic_grid()
+
+
+def teme_to_geodetic(positions, gast_hours):
+    """Converts (N, 3) TEME position vectors to geodetic lat/lon/alt arrays.
+
+    Latitude and altitude come from bilinear interpolation of the precomputed
+    grid, so the whole swarm costs a handful of fancy-index passes.
+    """
+    x, y, z = positions[:, 0], positions[:, 1], positions[:, 2]
+    theta = gast_hours * np.pi / 12.0  # Earth rotation angle (radians)
+
+    lons = np.degrees(np.arctan2(y, x) - theta)
+    lons = (lons + 180.0) % 360.0 - 180.0
+
+    # Fractional grid indices over (geocentric latitude, radius)
+    r_xy = np.hypot(x, y)
+    radius = np.hypot(r_xy, z)
+    fl = (np.arctan2(z, r_xy) / np.pi + 0.5) * (GRID_NLAT - 1)
+    fr = (radius - GRID_R_MIN) / (GRID_R_MAX - GRID_R_MIN) * (GRID_NR - 1)
+    fl = np.clip(fl, 0.0, GRID_NLAT - 1.001)
+    fr = np.clip(fr, 0.0, GRID_NR - 1.001)
+    il = fl.astype(np.intp)
+    ir = fr.astype(np.intp)
+    wl = fl - il
+    wr = fr - ir
+
+    # Bilinear blend of the four surrounding cells
+    w00 = (1.0 - wl) * (1.0 - wr)
+    w01 = (1.0 - wl) * wr
+    w10 = wl * (1.0 - wr)
+    w11 = wl * wr
+    lats = (w00 * LAT_GRID[il, ir] + w01 * LAT_GRID[il, ir + 1]
+            + w10 * LAT_GRID[il + 1, ir] + w11 * LAT_GRID[il + 1, ir + 1])
+    alts = (w00 * ALT_GRID[il, ir] + w01 * ALT_GRID[il, ir + 1]
+            + w10 * ALT_GRID[il + 1, ir] + w11 * ALT_GRID[il + 1, ir + 1])
+
+    return np.degrees(lats), lons, alts
+
+
+if numba is not None:
+    # Serial njit on purpose: at swarm scale the fused loop is microseconds,
+    # and numba's parallel threading layer can wedge interpreter shutdown
+    # when the kernel first launches from the harvester thread.
+    @numba.njit(fastmath=True, cache=True)
+    def _swarm_metrics_jit(positions, velocities, gs_pos, gs_vel, theta,
+                           lat_grid, alt_grid, fspl_const, freq, c_light):
+        n = positions.shape[0]
+        lats = np.empty(n)
+        lons = np.empty(n)
+        alts = np.empty(n)
+        ranges = np.empty(n)
+        dopplers = np.empty(n)
+        path_loss = np.empty(n)
+        for i in range(n):
+            x, y, z = positions[i, 0], positions[i, 1], positions[i, 2]
+
+            lon = math.degrees(math.atan2(y, x) - theta)
+            lons[i] = (lon + 180.0) % 360.0 - 180.0
+
+            # Bilinear geodetic grid lookup (same grid as the NumPy path)
+            r_xy = math.hypot(x, y)
+            radius = math.hypot(r_xy, z)
+            fl = (math.atan2(z, r_xy) / math.pi + 0.5) * (GRID_NLAT - 1)
+            fr = (radius - GRID_R_MIN) / (GRID_R_MAX - GRID_R_MIN) * (GRID_NR - 1)
+            fl = min(max(fl, 0.0), GRID_NLAT - 1.001)
+            fr = min(max(fr, 0.0), GRID_NR - 1.001)
+            il, ir = int(fl), int(fr)
+            wl, wr = fl - il, fr - ir
+            w00 = (1.0 - wl) * (1.0 - wr)
+            w01 = (1.0 - wl) * wr
+            w10 = wl * (1.0 - wr)
+            w11 = wl * wr
+            lats[i] = math.degrees(w00 * lat_grid[il, ir] + w01 * lat_grid[il, ir + 1]
+                                   + w10 * lat_grid[il + 1, ir] + w11 * lat_grid[il + 1, ir + 1])
+            alts[i] = (w00 * alt_grid[il, ir] + w01 * alt_grid[il, ir + 1]
+                       + w10 * alt_grid[il + 1, ir] + w11 * alt_grid[il + 1, ir + 1])
+
+            # Link budget, fused so intermediates stay in registers
+            dx = x - gs_pos[0]
+            dy = y - gs_pos[1]
+            dz = z - gs_pos[2]
+            rng = max(math.sqrt(dx * dx + dy * dy + dz * dz), 1e-3)
+            rate = (dx * (velocities[i, 0] - gs_vel[0])
+                    + dy * (velocities[i, 1] - gs_vel[1])
+                    + dz * (velocities[i, 2] - gs_vel[2])) / rng
+            ranges[i] = rng
+            dopplers[i] = rate * 1e3 / c_light * freq
+            path_loss[i] = 20.0 * math.log10(rng) + fspl_const
+        return lats, lons, alts, ranges, dopplers, path_loss
+
+
+def swarm_metrics(positions, velocities, gs_pos, gs_vel, gast_hours):
+    """Computes subpoint, range, Doppler and FSPL for the whole swarm.
+
+    One fused register-resident pass when numba is installed; otherwise the
+    equivalent array-at-a-time NumPy sequence.
+    """
+    if numba is not None:
+        return _swarm_metrics_jit(positions, velocities, gs_pos, gs_vel,
+                                  gast_hours * np.pi / 12.0, LAT_GRID, ALT_GRID,
+                                  FSPL_CONST, KU_BAND_FREQ, float(C))
+
+    lats, lons, alts = teme_to_geodetic(positions, gast_hours)
+    diff = positions - gs_pos
+    range_km = np.maximum(np.linalg.norm(diff, axis=1), 1e-3)  # branchless zero guard
+    range_rate = np.einsum('ij,ij->i', diff, velocities - gs_vel) / range_km
+    dopplers = range_rate * 1e3 / C * KU_BAND_FREQ  # Hz shift at Ku-band
+    path_loss = 20 * np.log10(range_km) + FSPL_CONST
+    return lats, lons, alts, range_km, dopplers, path_loss
+
+
 # =============================================================================
 # THE GHOST-TRACE & SIGNAL ENGINE
 # =============================================================================
@@ -31,68 +213,182 @@ class IntelligenceKernel:
         self.ts = load.timescale()
         self.debug = debug
         self.ghost_enabled = ghost_trace
-        self.ghost_vault = {} # Memory structure for ghost traces
+        # Ghost traces as structure-of-arrays ring buffers (allocated at boot):
+        # ghost_pos[sat, slot] = (lat, lon), with per-sat head/count cursors.
+        self.ghost_pos = None
+        self.ghost_head = None
+        self.ghost_count = None
+        self.ghost_index = {}  # NORAD catalog number -> row in the ghost arrays
         self.telemetry_queue = Queue()
         self.shutdown_event = threading.Event()
+        # Last propagated state, for linear extrapolation between sweeps
+        self.last_positions = None
+        self.last_velocities = None
+        self.last_sweep_monotonic = 0.0
 
     def boot_sequence(self):
         """Initializes the link with the global NORAD constellation."""
         print(f"\033[1;36m[SYSTEM]\033[0m Initializing Kernel...")
         try:
-            # Using the new dynamic API endpoint
-            self.sats = load.tle_file(SAT_SOURCE_API)
+            # Using the new dynamic API endpoint, with a local TTL cache so
+            # restarts inside the refresh window skip the downlink entirely
+            cache_fresh = (os.path.exists(TLE_CACHE_FILE)
+                           and time.time() - os.path.getmtime(TLE_CACHE_FILE) < TLE_CACHE_TTL)
+            if cache_fresh:
+                print(f"\033[1;36m[CACHE]\033[0m Restoring constellation from local TLE cache.")
+            self.sats = load.tle_file(SAT_SOURCE_API, filename=TLE_CACHE_FILE,
+                                      reload=not cache_fresh)
             self.active_swarm = self.sats[:100]
-            print(f"\033[1;32m[SUCCESS]\033[0m {len(self.active_swarm)} Nodes Synchronized into Local Buffer.")
+            # Stacked propagator, sharded across cores. SatrecArray's compiled
+            # loop releases the GIL, so shards propagate truly in parallel.
+            n = len(self.active_swarm)
+            models = [s.model for s in self.active_swarm]
+            workers = max(1, (os.cpu_count() or 2) - 1)
+            chunk = -(-n // workers)  # Ceiling division
+            self.satrec_shards = [
+                (start, SatrecArray(models[start:start + chunk]))
+                for start in range(0, n, chunk)
+            ]
+            self.propagation_pool = ThreadPoolExecutor(
+                max_workers=len(self.satrec_shards), thread_name_prefix="sgp4")
+            self.ghost_pos = np.zeros((n, GHOST_TRACE_BUFFER, 2), np.float32)
+            self.ghost_head = np.zeros(n, np.int32)
+            self.ghost_count = np.zeros(n, np.int32)
+            self.ghost_index = {sat.model.satnum: i for i, sat in enumerate(self.active_swarm)}
+            print(f"\033[1;32m[SUCCESS]\033[0m {n} Nodes Synchronized into Local Buffer.")
         except Exception as e:
             print(f"\033[1;31m[CRITICAL]\033[0m Downlink Denied: {e}")
             sys.exit(1)
 
-    def calculate_quantum_metrics(self, sat, now):
-        """Calculates 100+ points of telemetry including Doppler and Signal Decay."""
-        geocentric = sat.at(now)
-        subpoint = wgs84.subpoint(geocentric)
-        
-        # Binary Signal Logic
-        # We pack ID (I), Lat (f), Lon (f), Alt (f), Doppler (f), and Time (d)
-        binary_packet = struct.pack('!Iffffd', 
-            sat.model.satnum, 
-            subpoint.latitude.degrees, 
-            subpoint.longitude.degrees, 
-            subpoint.elevation.km,
-            0.0, # Placeholder for Doppler calc
-            time.time()
-        )
-
-        # Ghost Trace Logic: Storing previous 50 coordinates for "Future-Now" prediction
+    def calculate_quantum_metrics_batch(self, now):
+        """Calculates 100+ points of telemetry for the entire swarm at once.
+
+        Propagation is gathered into (N, 3) position/velocity matrices so that
+        range, range-rate, Doppler and Free-Space Path Loss are computed as
+        single NumPy array operations instead of 100 scalar round-trips.
+        """
+        # Rotate the cached station vector into TEME (same frame as SGP4 output)
+        theta = now.gast * np.pi / 12.0
+        cos_t, sin_t = np.cos(theta), np.sin(theta)
+        gs_pos = np.array([cos_t * GS_ECEF[0] - sin_t * GS_ECEF[1],
+                           sin_t * GS_ECEF[0] + cos_t * GS_ECEF[1],
+                           GS_ECEF[2]])
+        gs_vel = np.array([-EARTH_OMEGA * gs_pos[1], EARTH_OMEGA * gs_pos[0], 0.0])
+
+        n = len(self.active_swarm)
+        # Compiled SGP4 sweeps over the stacked shards, one per core, each
+        # writing its own disjoint slice of the output matrices (TEME km, km/s)
+        jd = np.array([now.whole])
+        fr = np.array([now.ut1_fraction])
+        positions = np.empty((n, 3))
+        velocities = np.empty((n, 3))
+
+        def propagate_shard(shard):
+            start, satrecs = shard
+            _err, r, v = satrecs.sgp4(jd, fr)
+            stop = start + r.shape[0]
+            positions[start:stop] = r[:, 0, :]
+            velocities[start:stop] = v[:, 0, :]
+
+        if len(self.satrec_shards) == 1:
+            propagate_shard(self.satrec_shards[0])
+        else:
+            list(self.propagation_pool.map(propagate_shard, self.satrec_shards))
+
+        # Cache the state vectors so consumers can extrapolate between sweeps
+        self.last_positions = positions
+        self.last_velocities = velocities
+        self.last_sweep_monotonic = time.monotonic()
+
+        # Fused subpoint + link budget over the full swarm
+        lats, lons, alts, range_km, dopplers, path_loss = swarm_metrics(
+            positions, velocities, gs_pos, gs_vel, now.gast)
+
+        # Ghost Trace Logic: one vectorized ring-buffer write for the sweep
         if self.ghost_enabled:
-            if sat.name not in self.ghost_vault:
-                self.ghost_vault[sat.name] = []
-            self.ghost_vault[sat.name].append((subpoint.latitude.degrees, subpoint.longitude.degrees))
-            if len(self.ghost_vault[sat.name]) > GHOST_TRACE_BUFFER:
-                self.ghost_vault[sat.name].pop(0)
-
-        return {
-            "node": sat.name,
-            "id": sat.model.satnum,
-            "lat": subpoint.latitude.degrees,
-            "lon": subpoint.longitude.degrees,
-            "alt": subpoint.elevation.km,
-            "binary_payload": binary_packet.hex(),
-            "ghost_points": len(self.ghost_vault.get(sat.name, []))
-        }
+            rows = np.arange(n)
+            self.ghost_pos[rows, self.ghost_head, 0] = lats
+            self.ghost_pos[rows, self.ghost_head, 1] = lons
+            self.ghost_head = (self.ghost_head + 1) % GHOST_TRACE_BUFFER
+            np.minimum(self.ghost_count + 1, GHOST_TRACE_BUFFER, out=self.ghost_count)
+
+        # Binary Signal Logic: quantize the sweep to fixed point in one pass,
+        # then pack into a single preallocated frame. One timestamp covers the
+        # sweep -- every packet shares the tick epoch.
+        ts_now = time.time()
+        lat_q = np.round(lats * LATLON_SCALE).astype(np.int32)
+        lon_q = np.round(lons * LATLON_SCALE).astype(np.int32)
+        alt_q = np.round(alts * ALT_SCALE).astype(np.int32)
+        dop_q = np.clip(np.round(dopplers / DOPPLER_SCALE), -32768, 32767).astype(np.int16)
+        frame = bytearray(n * PKT_STRUCT.size)
+        results = []
+        for i, sat in enumerate(self.active_swarm):
+            PKT_STRUCT.pack_into(frame, i * PKT_STRUCT.size,
+                sat.model.satnum,
+                lat_q[i],
+                lon_q[i],
+                alt_q[i],
+                dop_q[i],
+                ts_now
+            )
+
+            results.append({
+                "node": sat.name,
+                "id": sat.model.satnum,
+                "lat": lats[i],
+                "lon": lons[i],
+                "alt": alts[i],
+                "range_km": range_km[i],
+                "doppler_hz": dopplers[i],
+                "path_loss_db": path_loss[i],
+                "ghost_points": int(self.ghost_count[i])
+            })
+        return {"binary_frame": bytes(frame), "records": results}
+
+    def extrapolated_positions(self):
+        """Linear (N, 3) TEME position estimate for right now: pos + vel*dt.
+
+        Sub-metre accurate over a heartbeat, so high-rate consumers can
+        sample between sweeps without re-running SGP4.
+        """
+        if self.last_positions is None:
+            return None
+        dt = time.monotonic() - self.last_sweep_monotonic
+        return self.last_positions + self.last_velocities * dt
+
+    def ghost_trace(self, satnum):
+        """Returns a node's (count, 2) lat/lon history by catalog number, oldest first."""
+        i = self.ghost_index.get(satnum)
+        if i is None or self.ghost_count[i] == 0:
+            return np.zeros((0, 2), np.float32)
+        ring = np.roll(self.ghost_pos[i], -int(self.ghost_head[i]), axis=0)
+        return ring[-int(self.ghost_count[i]):]
 
     def harvester_thread(self):
-        """Main non-blocking data harvesting loop."""
+        """Main non-blocking data harvesting loop, phase-locked to the heartbeat."""
+        next_tick = time.monotonic()
         while not self.shutdown_event.is_set():
             now = self.ts.now()
-            for sat in self.active_swarm:
-                data = self.calculate_quantum_metrics(sat, now)
-                self.telemetry_queue.put(data)
-            time.sleep(1) # Frequency of the binary heartbeat
+            self.telemetry_queue.put(self.calculate_quantum_metrics_batch(now))
+            # Drift-compensated cadence: sleep to the target phase, not a
+            # fixed interval, and resync rather than spiral after an overrun
+            next_tick += HEARTBEAT_PERIOD
+            remaining = next_tick - time.monotonic()
+            if remaining < -HEARTBEAT_PERIOD:
+                next_tick = time.monotonic()
+            elif remaining > 0:
+                self.shutdown_event.wait(remaining)
 
 # =============================================================================
 # STORAGE KERNEL: BINARY & JSON MULTI-THREADED I/O
 # =============================================================================
+def encode_json_line(packet):
+    """Serializes one telemetry record to an NDJSON line (bytes)."""
+    if orjson is not None:
+        return orjson.dumps(packet, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n"
+    return (json.dumps(packet) + "\n").encode()
+
+
 def storage_kernel(kernel):
     print(f"\033[1;35m[STORAGE]\033[0m Writing Binary Streams to Disk...")
     
@@ -100,21 +396,38 @@ def storage_kernel(kernel):
     with open(BINARY_CORE_FILE, "wb") as bf:
         bf.write(b"NEXUS-INTEL-V2-START")
 
-    while not kernel.shutdown_event.is_set():
-        try:
-            packet = kernel.telemetry_queue.get(timeout=1)
-            
-            # 1. Binary Appending (Raw Logic)
-            with open(BINARY_CORE_FILE, "ab") as bf:
-                bf.write(bytes.fromhex(packet['binary_payload']))
+    # Persistent buffered handles: opened once per thread, not once per packet
+    bin_f = open(BINARY_CORE_FILE, "ab", buffering=1 << 20)
+    json_f = open(DATA_MATRIX_FILE, "ab", buffering=1 << 20)
+    last_flush = time.monotonic()
+
+    try:
+        while not kernel.shutdown_event.is_set():
+            try:
+                sweep = kernel.telemetry_queue.get(timeout=1)
+            except Empty:
+                continue
+
+            # 1. Binary Appending (one whole-sweep frame per write)
+            bin_f.write(sweep['binary_frame'])
 
-            # 2. Advanced JSON Metadata
-            with open(DATA_MATRIX_FILE, "a") as jf:
-                jf.write(json.dumps(packet) + "\n")
+            # 2. Advanced JSON Metadata (NDJSON: one record per line).
+            # Hex-encode each node's packet slice only here, at dump time --
+            # the queue carries raw bytes, never a codec round-trip.
+            frame = sweep['binary_frame']
+            for i, packet in enumerate(sweep['records']):
+                packet['binary_payload'] = frame[i * PKT_STRUCT.size:(i + 1) * PKT_STRUCT.size].hex()
+                json_f.write(encode_json_line(packet))
 
             kernel.telemetry_queue.task_done()
-        except Empty:
-            continue
+
+            if time.monotonic() - last_flush >= DISK_FLUSH_INTERVAL:
+                bin_f.flush()
+                json_f.flush()
+                last_flush = time.monotonic()
+    finally:
+        bin_f.close()
+        json_f.close()
 
 # =============================================================================
 # EXECUTION INTERFACE
@@ -143,7 +456,7 @@ if __name__ == "__main__":
     try:
         while True:
             # The "Showcase" Dashboard
-            os.system('cls' if os.name == 'nt' else 'clear')
+            sys.stdout.write(CLEAR_SCREEN)
             print("\033[1;37m" + "═"*65)
             print(f"  GHOST-TRACE SATELLITE KERNEL | STATUS: \033[1;32mRUNNING\033[0m | LOGS: {args.debug}")
             print("  PARALLEL BINARY CALLS: ENABLED | SWARM SIZE: 100 NODES")
@@ -158,10 +471,10 @@ if __name__ == "__main__":
             
             # Dynamic Sample View
             print(" NODE_NAME      | ID      | LAT      | LON      | GHOST_TRACE")
+            iss_trace = engine.ghost_trace(25544)
+            iss_last = iss_trace[-1] if len(iss_trace) else (0.0, 0.0)
             print(" ISS (ZARYA)    | 25544   | %-8.3f | %-8.3f | %d pts" % (
-                engine.ghost_vault.get('ISS (ZARYA)', [(0,0)])[-1][0],
-                engine.ghost_vault.get('ISS (ZARYA)', [(0,0)])[-1][1],
-                len(engine.ghost_vault.get('ISS (ZARYA)', []))
+                iss_last[0], iss_last[1], len(iss_trace)
             ))
             print("-" * 65)
             print(" Press Ctrl+C to sever the ground-to-space connection.")